@@ -9,13 +9,24 @@ import crypto from "crypto";
 const pkgPath = path.join(process.cwd(), "package.json");
 const pkg = JSON.parse(fs.readFileSync(pkgPath, "utf-8"));
 
+// Optional: only rebuild the listed widgets (e.g. WIDGETS=pizza_map,pizza_list)
+// and keep the other outputs in assets/ untouched
+const onlyWidgets = (process.env.WIDGETS || "")
+  .split(",")
+  .map((name) => name.trim())
+  .filter(Boolean);
+
 // Find all widget directories with index.{tsx,jsx}
 const widgetDirs = fg.sync("widgets/*/", { onlyDirectories: true });
 const entries = widgetDirs.map((dir) => {
   const dirPath = dir.endsWith('/') ? dir : dir + '/';
   const indexFiles = fg.sync(`${dirPath}index.{tsx,jsx}`);
   return indexFiles[0];
-}).filter(Boolean);
+}).filter(Boolean).filter(
+  (file) =>
+    onlyWidgets.length === 0 ||
+    onlyWidgets.includes(path.basename(path.dirname(file)))
+);
 const outDir = "assets";
 
 function wrapEntryPlugin(
@@ -52,7 +63,9 @@ function wrapEntryPlugin(
   };
 }
 
-fs.rmSync(outDir, { recursive: true, force: true });
+if (onlyWidgets.length === 0) {
+  fs.rmSync(outDir, { recursive: true, force: true });
+}
 fs.mkdirSync(outDir, { recursive: true });
 
 const builtNames: string[] = [];
@@ -114,10 +127,10 @@ for (const file of entries) {
   console.log(`Built ${name}`);
 }
 
-const outputs = fs
-  .readdirSync("assets")
-  .filter((f) => f.endsWith(".js") || f.endsWith(".css"))
-  .map((f) => path.join("assets", f))
+// Only hash the outputs of this run (already-hashed files from earlier builds stay as-is)
+const outputs = builtNames
+  .flatMap((name) => [`${name}.js`, `${name}.css`])
+  .map((f) => path.join(outDir, f))
   .filter((p) => fs.existsSync(p));
 
 const renamed = [];
@@ -0,0 +1,208 @@
+"""
+Admission control - tool 호출 동시성 제한 및 load shedding
+
+call_tool 요청은 하나의 event loop에서 처리되므로, 버스트가 오면 대기열이
+무한히 쌓이고 모든 요청의 latency가 함께 늘어납니다.
+여기서는 전역/tool별 동시 실행 수를 제한하고, 대기열 길이와 대기 시간을
+제한한 뒤 초과 요청은 retry-after 힌트와 함께 즉시 거절합니다.
+"""
+
+import asyncio
+import math
+import os
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from mcp import types
+
+
+def _parse_limits(raw: str) -> Dict[str, int]:
+    """"pizza_map=4,pizza_list=8" 형식의 문자열을 dict로 변환"""
+    limits = {}
+    for item in raw.split(","):
+        if not item.strip():
+            continue
+        name, _, value = item.partition("=")
+        limits[name.strip()] = int(value)
+    return limits
+
+
+@dataclass
+class AdmissionConfig:
+    """Admission control 설정 (기본값은 환경 변수로 덮어쓸 수 있음)"""
+
+    max_inflight: int = 64
+    max_inflight_per_tool: int = 16
+    tool_limits: Dict[str, int] = field(default_factory=dict)
+    queue_size: int = 128
+    queue_timeout: float = 2.0
+
+    @classmethod
+    def from_env(cls) -> "AdmissionConfig":
+        """
+        환경 변수에서 설정 로드
+
+        - MAX_INFLIGHT_CALLS: 전역 동시 실행 수
+        - MAX_INFLIGHT_PER_TOOL: tool별 기본 동시 실행 수
+        - TOOL_CONCURRENCY: tool별 개별 제한 (예: "pizza_map=4,pizza_list=8")
+        - ADMISSION_QUEUE_SIZE: 대기열 최대 길이
+        - ADMISSION_QUEUE_TIMEOUT: 대기열 최대 대기 시간 (초)
+        """
+        config = cls()
+        env = os.environ
+        if env.get("MAX_INFLIGHT_CALLS"):
+            config.max_inflight = int(env["MAX_INFLIGHT_CALLS"])
+        if env.get("MAX_INFLIGHT_PER_TOOL"):
+            config.max_inflight_per_tool = int(env["MAX_INFLIGHT_PER_TOOL"])
+        if env.get("TOOL_CONCURRENCY"):
+            config.tool_limits = _parse_limits(env["TOOL_CONCURRENCY"])
+        if env.get("ADMISSION_QUEUE_SIZE"):
+            config.queue_size = int(env["ADMISSION_QUEUE_SIZE"])
+        if env.get("ADMISSION_QUEUE_TIMEOUT"):
+            config.queue_timeout = float(env["ADMISSION_QUEUE_TIMEOUT"])
+        return config
+
+
+class Overloaded(Exception):
+    """요청이 거절되었을 때 발생 (retry_after: 재시도까지 권장 대기 시간, 초)"""
+
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(f"Server overloaded ({reason}), retry after {retry_after}s")
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """전역/tool별 semaphore와 bounded 대기열로 in-flight 작업을 제한"""
+
+    def __init__(self, config: Optional[AdmissionConfig] = None):
+        self.config = config or AdmissionConfig()
+        self._global = asyncio.Semaphore(self.config.max_inflight)
+        self._tools: Dict[str, asyncio.Semaphore] = {}
+        self._waiting = 0
+        self._inflight: Dict[str, int] = {}
+        self._avg_service_time = 0.0
+
+        self.admitted = 0
+        self.rejected: Dict[str, int] = {"queue_full": 0, "timeout": 0}
+
+    def _tool_semaphore(self, tool_name: str) -> asyncio.Semaphore:
+        if tool_name not in self._tools:
+            limit = self.config.tool_limits.get(
+                tool_name, self.config.max_inflight_per_tool
+            )
+            self._tools[tool_name] = asyncio.Semaphore(limit)
+        return self._tools[tool_name]
+
+    def _retry_after(self) -> int:
+        """현재 대기열을 비우는 데 걸릴 예상 시간 (최소 1초)"""
+        drain = self._avg_service_time * (self._waiting + 1) / self.config.max_inflight
+        return max(1, math.ceil(drain))
+
+    def _reject(self, reason: str) -> Overloaded:
+        self.rejected[reason] += 1
+        return Overloaded(reason, self._retry_after())
+
+    async def _acquire(self, tool_sem: asyncio.Semaphore):
+        # 항상 tool → global 순서로 획득 (교착 방지)
+        await tool_sem.acquire()
+        try:
+            await self._global.acquire()
+        except BaseException:
+            tool_sem.release()
+            raise
+
+    @asynccontextmanager
+    async def admit(self, tool_name: str):
+        """
+        tool 실행 슬롯 획득
+
+        대기열이 가득 찼거나 queue_timeout 안에 슬롯을 얻지 못하면 Overloaded 발생
+        """
+        tool_sem = self._tool_semaphore(tool_name)
+
+        if tool_sem.locked() or self._global.locked():
+            if self._waiting >= self.config.queue_size:
+                raise self._reject("queue_full")
+
+            self._waiting += 1
+            try:
+                await asyncio.wait_for(
+                    self._acquire(tool_sem), timeout=self.config.queue_timeout
+                )
+            except asyncio.TimeoutError:
+                raise self._reject("timeout") from None
+            finally:
+                self._waiting -= 1
+        else:
+            await self._acquire(tool_sem)
+
+        self.admitted += 1
+        self._inflight[tool_name] = self._inflight.get(tool_name, 0) + 1
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            elapsed = time.monotonic() - started
+            # 서비스 시간 EWMA (retry-after 추정용)
+            self._avg_service_time = 0.9 * self._avg_service_time + 0.1 * elapsed
+            self._inflight[tool_name] -= 1
+            self._global.release()
+            tool_sem.release()
+
+    def metrics(self) -> Dict[str, Any]:
+        """현재 상태 스냅샷"""
+        return {
+            "inflight": sum(self._inflight.values()),
+            "inflight_by_tool": dict(self._inflight),
+            "waiting": self._waiting,
+            "admitted": self.admitted,
+            "rejected": dict(self.rejected),
+            "avg_service_time": round(self._avg_service_time, 4),
+            "limits": {
+                "max_inflight": self.config.max_inflight,
+                "max_inflight_per_tool": self.config.max_inflight_per_tool,
+                "tool_limits": dict(self.config.tool_limits),
+                "queue_size": self.config.queue_size,
+                "queue_timeout": self.config.queue_timeout,
+            },
+        }
+
+
+def install_admission_control(server, controller: AdmissionController):
+    """WidgetMCPServer의 call_tool 핸들러를 admission control로 감싸기"""
+    mcp_server = server.mcp._mcp_server
+    call_tool = mcp_server.request_handlers[types.CallToolRequest]
+
+    async def admitted_call_tool(req: types.CallToolRequest) -> types.ServerResult:
+        # 모르는 tool 이름은 semaphore/metrics를 만들지 않고 그대로 통과
+        # (원래 핸들러가 바로 "Unknown tool" 에러를 반환)
+        if req.params.name not in server.widgets_by_id:
+            return await call_tool(req)
+
+        try:
+            async with controller.admit(req.params.name):
+                return await call_tool(req)
+        except Overloaded as exc:
+            return types.ServerResult(
+                types.CallToolResult(
+                    content=[types.TextContent(type="text", text=str(exc))],
+                    isError=True,
+                    _meta={"retryAfter": exc.retry_after, "reason": exc.reason},
+                )
+            )
+
+    mcp_server.request_handlers[types.CallToolRequest] = admitted_call_tool
+
+
+def metrics_route(controller: AdmissionController):
+    """/metrics 엔드포인트 (JSON)"""
+    from starlette.responses import JSONResponse
+    from starlette.routing import Route
+
+    async def metrics(request):
+        return JSONResponse(controller.metrics())
+
+    return Route("/metrics", metrics, methods=["GET"])
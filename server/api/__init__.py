@@ -2,7 +2,7 @@
 API 모듈 - 비즈니스 로직 및 외부 API 호출
 """
 
-from .pizzeria_api import get_pizzerias
+from .pizzeria_api import get_pizzerias, warmup_pizzerias
 
-__all__ = ["get_pizzerias"]
+__all__ = ["get_pizzerias", "warmup_pizzerias"]
 
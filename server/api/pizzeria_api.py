@@ -1,31 +1,180 @@
+import asyncio
+import os
+import time
+from typing import Any, Dict, List, Optional
+
 import httpx
 
+from .resilience import (
+    BoundedCache,
+    CircuitBreaker,
+    CircuitOpenError,
+    DeadlineExceeded,
+    LatencyTracker,
+    hedged,
+    remaining_time,
+)
 
-async def get_pizzerias(topping: str):
-    """피자 가게 API 호출 (Mock Data)"""
-    # TODO: Replace with real API call
-    # Mock data for demonstration
-    mock_pizzerias = {
-        "Margherita": [
-            {"name": "Pizzeria Napoli", "address": "123 Main St", "rating": 4.5, "lat": 40.7128, "lng": -74.0060},
-            {"name": "Italian Corner", "address": "456 Oak Ave", "rating": 4.8, "lat": 40.7580, "lng": -73.9855},
-            {"name": "Roma Pizza House", "address": "789 Elm Rd", "rating": 4.3, "lat": 40.7489, "lng": -73.9680},
-        ],
-        "Pepperoni": [
-            {"name": "Pepperoni Paradise", "address": "321 Pine St", "rating": 4.7, "lat": 40.7614, "lng": -73.9776},
-            {"name": "Classic Pizza Co", "address": "654 Maple Dr", "rating": 4.4, "lat": 40.7306, "lng": -73.9352},
-        ],
-        "Hawaiian": [
-            {"name": "Tropical Pizza", "address": "987 Beach Blvd", "rating": 4.2, "lat": 40.7282, "lng": -74.0776},
-            {"name": "Island Slice", "address": "147 Ocean Ave", "rating": 4.6, "lat": 40.7589, "lng": -73.9851},
-        ],
-    }
-    
+# Mock data for demonstration (PIZZERIA_API_URL이 없을 때 사용)
+MOCK_PIZZERIAS = {
+    "Margherita": [
+        {"name": "Pizzeria Napoli", "address": "123 Main St", "rating": 4.5, "lat": 40.7128, "lng": -74.0060},
+        {"name": "Italian Corner", "address": "456 Oak Ave", "rating": 4.8, "lat": 40.7580, "lng": -73.9855},
+        {"name": "Roma Pizza House", "address": "789 Elm Rd", "rating": 4.3, "lat": 40.7489, "lng": -73.9680},
+    ],
+    "Pepperoni": [
+        {"name": "Pepperoni Paradise", "address": "321 Pine St", "rating": 4.7, "lat": 40.7614, "lng": -73.9776},
+        {"name": "Classic Pizza Co", "address": "654 Maple Dr", "rating": 4.4, "lat": 40.7306, "lng": -73.9352},
+    ],
+    "Hawaiian": [
+        {"name": "Tropical Pizza", "address": "987 Beach Blvd", "rating": 4.2, "lat": 40.7282, "lng": -74.0776},
+        {"name": "Island Slice", "address": "147 Ocean Ave", "rating": 4.6, "lat": 40.7589, "lng": -73.9851},
+    ],
+}
+
+
+def _mock_pizzerias(topping: str) -> List[Dict[str, Any]]:
     # Return pizzerias for the requested topping, or generic list
-    pizzerias = mock_pizzerias.get(topping, [
+    return MOCK_PIZZERIAS.get(topping, [
         {"name": f"{topping} Pizzeria", "address": "100 Demo St", "rating": 4.5, "lat": 40.7128, "lng": -74.0060},
         {"name": f"Best {topping} Pizza", "address": "200 Test Ave", "rating": 4.7, "lat": 40.7580, "lng": -73.9855},
     ])
-    
-    return pizzerias
 
+
+class PizzeriaClient:
+    """
+    피자 가게 upstream 클라이언트
+
+    base_url이 없으면 mock 데이터를 반환합니다. upstream 호출은
+    deadline → (선택) hedged request → circuit breaker 순으로 보호되고,
+    실패하면 마지막으로 성공한 (stale) 결과로 대체합니다.
+    stale 결과는 topping별로 최대 stale_max_entries개, stale_max_age초까지만 보관합니다.
+    cache_ttl초보다 새로운 결과는 upstream 호출 없이 그대로 사용합니다.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        timeout: float = 5.0,
+        hedge: bool = False,
+        breaker: Optional[CircuitBreaker] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        stale_max_entries: int = 256,
+        stale_max_age: float = 300.0,
+        cache_ttl: float = 30.0,
+    ):
+        self.base_url = base_url
+        self.timeout = timeout
+        self.hedge = hedge
+        self.breaker = breaker or CircuitBreaker()
+        self.latency = LatencyTracker()
+        self._transport = transport
+        self._http: Optional[httpx.AsyncClient] = None
+        self.cache_ttl = cache_ttl
+        self._cache = BoundedCache(max_entries=stale_max_entries, max_age=stale_max_age)
+
+    @classmethod
+    def from_env(cls) -> "PizzeriaClient":
+        """
+        환경 변수에서 설정 로드
+
+        - PIZZERIA_API_URL: upstream 주소 (없으면 mock 데이터)
+        - PIZZERIA_API_TIMEOUT: deadline이 없는 호출의 기본 timeout (초)
+        - PIZZERIA_API_HEDGE: "1"이면 hedged request 사용
+        - PIZZERIA_STALE_MAX_AGE: stale 결과 최대 보관 시간 (초)
+        - PIZZERIA_CACHE_TTL: upstream 호출 없이 캐시를 그대로 쓰는 시간 (초, 0이면 사용 안 함)
+        """
+        return cls(
+            base_url=os.environ.get("PIZZERIA_API_URL") or None,
+            timeout=float(os.environ.get("PIZZERIA_API_TIMEOUT", "5.0")),
+            hedge=os.environ.get("PIZZERIA_API_HEDGE") == "1",
+            breaker=CircuitBreaker.from_env(),
+            stale_max_age=float(os.environ.get("PIZZERIA_STALE_MAX_AGE", "300.0")),
+            cache_ttl=float(os.environ.get("PIZZERIA_CACHE_TTL", "30.0")),
+        )
+
+    async def _fetch_once(self, topping: str) -> List[Dict[str, Any]]:
+        if not self.base_url:
+            return _mock_pizzerias(topping)
+
+        if self._http is None:
+            self._http = httpx.AsyncClient(base_url=self.base_url, transport=self._transport)
+
+        started = time.monotonic()
+        response = await self._http.get("/pizzerias", params={"topping": topping})
+        response.raise_for_status()
+        self.latency.record(time.monotonic() - started)
+        return response.json()
+
+    async def _fetch(self, topping: str) -> List[Dict[str, Any]]:
+        # 호출자의 deadline이 upstream timeout보다 먼저 끝나면 그 시간 안에서만 기다림
+        remaining = remaining_time()
+        caller_bound = remaining is not None and remaining < self.timeout
+        if caller_bound and remaining <= 0:
+            raise DeadlineExceeded("Call deadline exceeded")
+
+        if self.hedge:
+            call = hedged(lambda: self._fetch_once(topping), self.latency.p95())
+        else:
+            call = self._fetch_once(topping)
+        try:
+            return await asyncio.wait_for(call, timeout=remaining if caller_bound else self.timeout)
+        except asyncio.TimeoutError:
+            # 남은 시간이 관측된 p95보다 짧았다면 호출자 탓 (breaker에 기록하지 않음).
+            # 평소라면 충분한 시간이었는데 응답이 없었다면 upstream 실패로 기록
+            if caller_bound and remaining < self.latency.p95(default=0.0):
+                raise DeadlineExceeded("Call deadline exceeded") from None
+            raise
+
+    def _remember(self, topping: str, pizzerias: List[Dict[str, Any]]):
+        # mock 데이터는 즉시 만들어지므로 캐시하지 않음 (입력 문자열마다 쌓이지 않도록)
+        if self.base_url:
+            self._cache.put(topping, pizzerias)
+
+    def _fresh(self, topping: str) -> Optional[List[Dict[str, Any]]]:
+        if self.cache_ttl <= 0:
+            return None
+        return self._cache.get(topping, max_age=self.cache_ttl)
+
+    async def get_pizzerias(self, topping: str) -> List[Dict[str, Any]]:
+        fresh = self._fresh(topping)
+        if fresh is not None:
+            return fresh
+
+        try:
+            pizzerias = await self.breaker.call(self._fetch, topping)
+        except (CircuitOpenError, asyncio.TimeoutError, httpx.HTTPError):
+            stale = self._cache.get(topping)
+            if stale is None:
+                raise
+            return stale
+
+        self._remember(topping, pizzerias)
+        return pizzerias
+
+    async def warmup(self, toppings: List[str]):
+        """
+        HTTP 연결을 열고 hot topping 결과를 캐시에 미리 채움
+
+        일부 topping 실패는 무시하고, 전부 실패하면 첫 번째 에러를 다시 발생시킵니다.
+        """
+        results = await asyncio.gather(
+            *(self.get_pizzerias(topping) for topping in toppings),
+            return_exceptions=True,
+        )
+        errors = [r for r in results if isinstance(r, Exception)]
+        if errors and len(errors) == len(results):
+            raise errors[0]
+
+
+_client = PizzeriaClient.from_env()
+
+
+async def get_pizzerias(topping: str):
+    """피자 가게 API 호출 (PIZZERIA_API_URL이 없으면 Mock Data)"""
+    return await _client.get_pizzerias(topping)
+
+
+async def warmup_pizzerias(toppings: List[str]):
+    """서버 시작 시 hot topping 캐시 채우기"""
+    await _client.warmup(toppings)
@@ -0,0 +1,255 @@
+"""
+외부 API 호출 보호 - deadline 전파, hedged request, circuit breaker
+
+upstream 노드 하나가 느려지면 그대로 tool 응답의 tail latency가 됩니다.
+- deadline: tool 호출 단위의 시간 예산을 contextvar로 전파
+- hedged: p95 지연 이후에도 응답이 없으면 두 번째 요청을 보내고 먼저 온 응답 사용
+- CircuitBreaker: 에러율이 급증하면 upstream 호출 없이 즉시 실패 (호출자가 stale 데이터로 대체)
+"""
+
+import asyncio
+import os
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Optional
+
+from mcp import types
+
+_deadline: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+
+
+class DeadlineExceeded(asyncio.TimeoutError):
+    """
+    호출자의 deadline 초과 (upstream 장애가 아니므로 circuit breaker에 기록하지 않음)
+
+    남은 시간이 upstream의 관측된 p95보다 짧아 공정한 시도가 아니었던 경우에만 사용합니다.
+    """
+
+
+@contextmanager
+def deadline_scope(timeout: float):
+    """현재 context에 deadline 설정 (바깥 deadline이 더 짧으면 그쪽을 유지)"""
+    deadline = time.monotonic() + timeout
+    outer = _deadline.get()
+    if outer is not None:
+        deadline = min(deadline, outer)
+
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time(default: Optional[float] = None) -> Optional[float]:
+    """현재 deadline까지 남은 시간 (초). deadline이 없으면 default 반환"""
+    deadline = _deadline.get()
+    if deadline is None:
+        return default
+    return max(0.0, deadline - time.monotonic())
+
+
+def install_call_deadline(server, timeout: float):
+    """
+    call_tool 핸들러에 per-call deadline 적용
+
+    요청 _meta의 timeoutMs가 있으면 timeout보다 짧은 경우에 한해 사용합니다.
+    """
+    mcp_server = server.mcp._mcp_server
+    call_tool = mcp_server.request_handlers[types.CallToolRequest]
+
+    async def call_tool_with_deadline(req: types.CallToolRequest) -> types.ServerResult:
+        meta = req.params.meta or {}
+        if not isinstance(meta, dict):
+            meta = meta.model_dump()
+
+        budget = timeout
+        try:
+            requested = float(meta.get("timeoutMs")) / 1000
+        except (TypeError, ValueError):
+            requested = None
+        # 숫자가 아니거나 0 이하/NaN인 값은 무시
+        if requested is not None and requested > 0:
+            budget = min(budget, requested)
+
+        with deadline_scope(budget):
+            return await call_tool(req)
+
+    mcp_server.request_handlers[types.CallToolRequest] = call_tool_with_deadline
+
+
+class LatencyTracker:
+    """최근 성공 호출의 latency 분포 (hedge 지연 계산용)"""
+
+    def __init__(self, window: int = 100, min_samples: int = 20, default: float = 0.2):
+        self._samples = deque(maxlen=window)
+        self.min_samples = min_samples
+        self.default = default
+
+    def record(self, latency: float):
+        self._samples.append(latency)
+
+    def p95(self, default: Optional[float] = None) -> float:
+        """샘플이 충분하지 않으면 default (지정하지 않으면 self.default) 반환"""
+        if len(self._samples) < self.min_samples:
+            return self.default if default is None else default
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+
+async def hedged(make_call: Callable[[], Awaitable[Any]], delay: float) -> Any:
+    """
+    hedged request 실행
+
+    첫 번째 호출이 delay 안에 끝나지 않으면 두 번째 호출을 시작하고,
+    먼저 성공한 결과를 반환합니다. 남은 호출은 취소됩니다.
+    """
+    tasks = {asyncio.ensure_future(make_call())}
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if not done:
+            tasks.add(asyncio.ensure_future(make_call()))
+
+        error = None
+        while tasks:
+            done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = error or task.exception()
+        raise error
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+class CircuitOpenError(Exception):
+    """circuit이 열려 있어 upstream 호출을 건너뜀"""
+
+
+class CircuitBreaker:
+    """
+    최근 window개 호출의 에러율 기반 circuit breaker
+
+    - closed: 정상 호출, 에러율이 failure_threshold 이상이면 open
+    - open: reset_timeout 동안 CircuitOpenError로 즉시 실패
+    - half_open: 시험 호출 1개만 허용, 성공하면 closed / 실패하면 다시 open
+    """
+
+    def __init__(
+        self,
+        failure_threshold: float = 0.5,
+        window: int = 20,
+        min_calls: int = 5,
+        reset_timeout: float = 10.0,
+    ):
+        self.failure_threshold = failure_threshold
+        self.min_calls = min_calls
+        self.reset_timeout = reset_timeout
+        self._outcomes = deque(maxlen=window)
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def _open(self):
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+
+    def _record(self, success: bool):
+        self._outcomes.append(success)
+        failures = self._outcomes.count(False)
+        if (
+            len(self._outcomes) >= self.min_calls
+            and failures / len(self._outcomes) >= self.failure_threshold
+        ):
+            self._open()
+
+    async def call(self, fn: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        state = self.state
+        if state == "open" or (state == "half_open" and self._trial_in_flight):
+            raise CircuitOpenError("Upstream circuit is open")
+
+        trial = state == "half_open"
+        self._trial_in_flight = trial
+        try:
+            result = await fn(*args, **kwargs)
+        except DeadlineExceeded:
+            # 호출자 쪽 시간 부족 - upstream 상태와 무관하므로 기록하지 않음
+            raise
+        except Exception:
+            if trial:
+                self._open()
+            else:
+                self._record(False)
+            raise
+        finally:
+            if trial:
+                self._trial_in_flight = False
+
+        if trial:
+            self._opened_at = None
+        else:
+            self._record(True)
+        return result
+
+    @classmethod
+    def from_env(cls) -> "CircuitBreaker":
+        """
+        환경 변수에서 설정 로드
+
+        - BREAKER_FAILURE_THRESHOLD: open 기준 에러율 (0~1)
+        - BREAKER_RESET_TIMEOUT: open 유지 시간 (초)
+        """
+        breaker = cls()
+        if os.environ.get("BREAKER_FAILURE_THRESHOLD"):
+            breaker.failure_threshold = float(os.environ["BREAKER_FAILURE_THRESHOLD"])
+        if os.environ.get("BREAKER_RESET_TIMEOUT"):
+            breaker.reset_timeout = float(os.environ["BREAKER_RESET_TIMEOUT"])
+        return breaker
+
+
+class BoundedCache:
+    """최대 크기(LRU)와 최대 보관 시간이 있는 캐시"""
+
+    def __init__(self, max_entries: int = 256, max_age: float = 300.0):
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def get(self, key: str, max_age: Optional[float] = None) -> Optional[Any]:
+        """max_age(기본: 캐시의 max_age)보다 오래된 값은 None"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        stored_at, value = entry
+        age = time.monotonic() - stored_at
+        if age >= self.max_age:
+            del self._entries[key]
+            return None
+        if max_age is not None and age >= max_age:
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: Any):
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,138 @@
+"""
+개발 모드 watch - 변경된 위젯만 재빌드, 변경된 tool 모듈만 reload
+
+widgets/<name>/ 아래 파일이 바뀌면 해당 위젯만 빌드해서 (WIDGETS=<name>)
+실행 중인 WidgetMCPServer의 build_result를 교체하고,
+server/tools/*_tool.py가 바뀌면 그 모듈만 reload해서 tool 인스턴스를 교체합니다.
+서버 재시작은 필요 없습니다.
+"""
+
+import asyncio
+import importlib
+import os
+import platform
+import re
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, Set, Tuple
+
+from fastapps import WidgetBuildResult
+
+from server.lifespan import run_in_background
+from server.loader import TOOLS_DIR, tool_classes
+
+
+class DevReloader:
+    """파일 mtime을 polling해서 변경된 위젯/tool만 다시 로드"""
+
+    def __init__(self, server, project_root: Path, interval: float = 0.5):
+        self.server = server
+        self.project_root = project_root
+        self.widgets_dir = project_root / "widgets"
+        self.assets_dir = project_root / "assets"
+        self.interval = interval
+        self._mtimes = self._snapshot()
+
+    def _snapshot(self) -> Dict[Path, float]:
+        files = list(self.widgets_dir.glob("*/**/*")) + list(TOOLS_DIR.glob("*_tool.py"))
+        mtimes = {}
+        for p in files:
+            try:
+                if p.is_file():
+                    mtimes[p] = p.stat().st_mtime
+            except FileNotFoundError:
+                # 에디터 임시 파일 등 glob 이후 사라진 파일은 건너뜀
+                continue
+        return mtimes
+
+    def _changes(self) -> Tuple[Set[str], Set[str]]:
+        """(변경된 위젯 이름, 변경된 tool 모듈 이름)"""
+        mtimes = self._snapshot()
+        changed = {p for p, mtime in mtimes.items() if self._mtimes.get(p) != mtime}
+        self._mtimes = mtimes
+
+        widgets = {
+            p.relative_to(self.widgets_dir).parts[0]
+            for p in changed
+            if self.widgets_dir in p.parents
+        }
+        modules = {p.stem for p in changed if p.parent == TOOLS_DIR}
+        return widgets, modules
+
+    async def rebuild_widgets(self, names: Iterable[str]):
+        """지정한 위젯만 빌드하고 build_result 교체"""
+        names = sorted(names)
+        npx_cmd = "npx.cmd" if platform.system() == "Windows" else "npx"
+        env = os.environ.copy()
+        env["WIDGETS"] = ",".join(names)
+
+        process = await asyncio.create_subprocess_exec(
+            npx_cmd, "tsx", "build-all.mts", cwd=self.project_root, env=env
+        )
+        if await process.wait() != 0:
+            print(f"✗ Rebuild failed: {', '.join(names)}")
+            return
+
+        for name in names:
+            for html_file in self.assets_dir.glob(f"{name}-*.html"):
+                match = re.match(rf"{re.escape(name)}-([0-9a-f]{{4}})\.html$", html_file.name)
+                if match:
+                    self.swap_build_result(WidgetBuildResult(
+                        name=name, hash=match.group(1), html=html_file.read_text()
+                    ))
+
+    def swap_build_result(self, build_result: WidgetBuildResult):
+        widget = self.server.widgets_by_id.get(build_result.name)
+        if widget is None:
+            print(f"⚠ Warning: No tool loaded for widget '{build_result.name}'")
+            return
+        widget.build_result = build_result
+        print(f"✓ Swapped build: {build_result.name} (hash: {build_result.hash})")
+
+    def reload_tool_module(self, module_name: str):
+        """tool 모듈 reload 후 기존 build_result로 tool 인스턴스 교체"""
+        full_name = f"server.tools.{module_name}"
+        if full_name in sys.modules:
+            module = importlib.reload(sys.modules[full_name])
+        else:
+            module = importlib.import_module(full_name)
+
+        for name, obj in tool_classes(module):
+            old = self.server.widgets_by_id.get(obj.identifier)
+            if old is None:
+                print(f"⚠ Warning: '{obj.identifier}' is new, restart the server to load it")
+                continue
+
+            tool_instance = obj(old.build_result)
+            self.server._configure_widget_csp([tool_instance])
+            self.server.widgets_by_uri.pop(old.template_uri, None)
+            self.server.widgets_by_id[obj.identifier] = tool_instance
+            self.server.widgets_by_uri[tool_instance.template_uri] = tool_instance
+            print(f"✓ Reloaded tool: {name} (identifier: {obj.identifier})")
+
+    async def _poll(self):
+        widgets, modules = self._changes()
+
+        for module_name in sorted(modules):
+            try:
+                self.reload_tool_module(module_name)
+            except Exception as e:
+                print(f"✗ Error reloading {module_name}.py: {e}")
+
+        if widgets:
+            await self.rebuild_widgets(widgets)
+
+    async def watch(self):
+        print(f"👀 Watching {self.widgets_dir.name}/ and server/tools/ for changes")
+        while True:
+            await asyncio.sleep(self.interval)
+            # 한 번의 실패(npx 없음 등)로 watch task가 죽지 않도록 로그만 남기고 계속
+            try:
+                await self._poll()
+            except Exception as e:
+                print(f"✗ Dev reload error: {e}")
+
+
+def install_dev_reloader(app, reloader: DevReloader):
+    """app lifespan 동안 watch 실행"""
+    run_in_background(app, reloader.watch)
@@ -0,0 +1,18 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+
+def run_in_background(app, make_coro):
+    """app lifespan 동안 백그라운드 task 실행 (종료 시 취소)"""
+    original_lifespan = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan(app):
+        async with original_lifespan(app) as state:
+            task = asyncio.create_task(make_coro())
+            try:
+                yield state
+            finally:
+                task.cancel()
+
+    app.router.lifespan_context = lifespan
@@ -0,0 +1,45 @@
+from pathlib import Path
+import importlib
+import inspect
+
+from fastapps import BaseWidget
+
+TOOLS_DIR = Path(__file__).parent / "tools"
+
+
+def tool_classes(module):
+    """모듈에서 BaseWidget을 상속받은 클래스 찾기 (import된 추상 base class 제외)"""
+    return [
+        (name, obj)
+        for name, obj in inspect.getmembers(module, inspect.isclass)
+        if issubclass(obj, BaseWidget) and not inspect.isabstract(obj)
+    ]
+
+
+def auto_load_tools(build_results):
+    """tools 디렉토리에서 자동으로 Tool 클래스들을 로드"""
+    tools = []
+
+    # tools 디렉토리의 모든 Python 파일 스캔
+    for tool_file in TOOLS_DIR.glob("*_tool.py"):
+        module_name = tool_file.stem
+
+        try:
+            # 동적으로 모듈 import
+            module = importlib.import_module(f"server.tools.{module_name}")
+
+            for name, obj in tool_classes(module):
+                # Tool의 identifier로 build_result 찾기
+                tool_identifier = obj.identifier
+
+                if tool_identifier in build_results:
+                    tool_instance = obj(build_results[tool_identifier])
+                    tools.append(tool_instance)
+                    print(f"✓ Loaded tool: {name} (identifier: {tool_identifier})")
+                else:
+                    print(f"⚠ Warning: No build result found for tool '{tool_identifier}'")
+
+        except Exception as e:
+            print(f"✗ Error loading {tool_file.name}: {e}")
+
+    return tools
@@ -1,49 +1,27 @@
 from pathlib import Path
+import os
 import sys
-import importlib
-import inspect
 
 # Add parent directory to path for local imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 # Import Floydr framework
-from fastapps import WidgetBuilder, WidgetMCPServer, BaseWidget
+from fastapps import WidgetBuilder, WidgetMCPServer
 import uvicorn
 
-PROJECT_ROOT = Path(__file__).parent.parent
-TOOLS_DIR = Path(__file__).parent / "tools"
-
-
-def auto_load_tools(build_results):
-    """tools 디렉토리에서 자동으로 Tool 클래스들을 로드"""
-    tools = []
-    
-    # tools 디렉토리의 모든 Python 파일 스캔
-    for tool_file in TOOLS_DIR.glob("*_tool.py"):
-        module_name = tool_file.stem
-        
-        try:
-            # 동적으로 모듈 import
-            module = importlib.import_module(f"server.tools.{module_name}")
-            
-            # 모듈에서 BaseWidget을 상속받은 클래스 찾기
-            for name, obj in inspect.getmembers(module, inspect.isclass):
-                if issubclass(obj, BaseWidget) and obj is not BaseWidget:
-                    # Tool의 identifier로 build_result 찾기
-                    tool_identifier = obj.identifier
-                    
-                    if tool_identifier in build_results:
-                        tool_instance = obj(build_results[tool_identifier])
-                        tools.append(tool_instance)
-                        print(f"✓ Loaded tool: {name} (identifier: {tool_identifier})")
-                    else:
-                        print(f"⚠ Warning: No build result found for tool '{tool_identifier}'")
-        
-        except Exception as e:
-            print(f"✗ Error loading {tool_file.name}: {e}")
-    
-    return tools
+from server.admission import (
+    AdmissionConfig,
+    AdmissionController,
+    install_admission_control,
+    metrics_route,
+)
+from server.api.resilience import install_call_deadline
+from server.dev import DevReloader, install_dev_reloader
+from server.loader import auto_load_tools
+from server.streaming import install_streaming
+from server.warmup import Warmup, hot_toppings_from_env, install_warmup
 
+PROJECT_ROOT = Path(__file__).parent.parent
 
 # 1. 빌드
 builder = WidgetBuilder(PROJECT_ROOT)
@@ -57,7 +35,27 @@ if not tools:
 
 # 3. 서버 실행
 server = WidgetMCPServer(name="pizzaz-framework", widgets=tools)
+
+# StreamingWidget tool의 부분 결과를 progress notification으로 전송 (다른 tool은 그대로 통과)
+install_streaming(server)
+
+# 4. Admission control (동시성 제한 + load shedding)
+admission = AdmissionController(AdmissionConfig.from_env())
+install_admission_control(server, admission)
+
+# 5. Per-call deadline (대기열 시간 포함, 하위 API 호출로 전파)
+install_call_deadline(server, timeout=float(os.environ.get("TOOL_CALL_TIMEOUT", "10.0")))
+
 app = server.get_app()
+app.routes.append(metrics_route(admission))
+
+# 6. Warmup (완료 전까지 /ready 는 503)
+warmup = Warmup(server, toppings=hot_toppings_from_env())
+install_warmup(app, warmup)
+
+# 7. 개발 모드: 변경된 위젯만 재빌드, 변경된 tool 모듈만 reload (DEV_WATCH=1)
+if os.environ.get("DEV_WATCH") == "1":
+    install_dev_reloader(app, DevReloader(server, PROJECT_ROOT))
 
 if __name__ == "__main__":
     print(f"\n🚀 Starting server with {len(tools)} tools")
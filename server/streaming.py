@@ -0,0 +1,102 @@
+"""
+부분 결과 스트리밍 - 서버 쪽 extension point
+
+BaseWidget.execute는 모든 데이터가 모인 뒤 dict 하나를 반환합니다.
+StreamingWidget은 execute 대신 async generator stream()을 구현하고,
+부분 결과를 준비되는 대로 yield합니다.
+
+클라이언트가 progressToken을 보낸 경우 각 부분 결과는 MCP progress
+notification의 _meta["openai/partialResult"]로 즉시 전달되고,
+최종 응답에는 모든 부분 결과를 합친 structuredContent가 들어갑니다.
+
+현재 이 저장소의 tool과 위젯은 이 기능을 사용하지 않습니다. 위젯
+(useWidgetProps)은 최종 structuredContent만 읽고 progress notification을
+받을 방법이 없으므로, 부분 결과는 notification을 직접 처리하는 클라이언트에만 보입니다.
+"""
+from abc import abstractmethod
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional
+
+from fastapps import BaseWidget
+from mcp import types
+from pydantic import BaseModel
+
+PartialSink = Callable[[Dict[str, Any]], Awaitable[None]]
+
+_partial_sink: ContextVar[Optional[PartialSink]] = ContextVar("partial_sink", default=None)
+
+
+def merge_partial(result: Dict[str, Any], partial: Dict[str, Any]) -> Dict[str, Any]:
+    """부분 결과 병합 (list는 이어 붙이고 나머지 값은 덮어씀)"""
+    for key, value in partial.items():
+        if isinstance(value, list) and isinstance(result.get(key), list):
+            result[key] = result[key] + value
+        else:
+            result[key] = value
+    return result
+
+
+class StreamingWidget(BaseWidget):
+    """stream()으로 부분 결과를 yield하는 위젯"""
+
+    @abstractmethod
+    def stream(self, input_data: BaseModel) -> AsyncIterator[Dict[str, Any]]:
+        """
+        부분 결과를 준비되는 대로 yield
+
+        Example:
+            async def stream(self, input_data):
+                yield {"title": "...", "items": []}
+                async for batch in fetch_batches():
+                    yield {"items": batch}
+        """
+
+    async def execute(self, input_data: BaseModel, context=None, user=None) -> Dict[str, Any]:
+        sink = _partial_sink.get()
+        result: Dict[str, Any] = {}
+        async for partial in self.stream(input_data):
+            merge_partial(result, partial)
+            if sink is not None:
+                await sink(partial)
+        return result
+
+
+def install_streaming(server):
+    """StreamingWidget 호출 시 부분 결과를 progress notification으로 전송"""
+    mcp_server = server.mcp._mcp_server
+    call_tool = mcp_server.request_handlers[types.CallToolRequest]
+
+    async def streaming_call_tool(req: types.CallToolRequest) -> types.ServerResult:
+        widget = server.widgets_by_id.get(req.params.name)
+        progress_token = req.params.meta.progressToken if req.params.meta else None
+        if not isinstance(widget, StreamingWidget) or progress_token is None:
+            return await call_tool(req)
+
+        ctx = mcp_server.request_context
+        progress = 0
+
+        async def send_partial(partial: Dict[str, Any]):
+            nonlocal progress
+            progress += 1
+            await ctx.session.send_notification(
+                types.ServerNotification(
+                    types.ProgressNotification(
+                        method="notifications/progress",
+                        params=types.ProgressNotificationParams(
+                            progressToken=progress_token,
+                            progress=progress,
+                            message=widget.invoking,
+                            _meta={"openai/partialResult": partial},
+                        ),
+                    )
+                ),
+                related_request_id=ctx.request_id,
+            )
+
+        token = _partial_sink.set(send_partial)
+        try:
+            return await call_tool(req)
+        finally:
+            _partial_sink.reset(token)
+
+    mcp_server.request_handlers[types.CallToolRequest] = streaming_call_tool
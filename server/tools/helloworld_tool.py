@@ -21,7 +21,7 @@ class HelloWorldTool(BaseWidget):
         "resource_domains": []
     }
     
-    async def execute(self, input_data: HelloWorldInput) -> Dict[str, Any]:
+    async def execute(self, input_data: HelloWorldInput, context=None, user=None) -> Dict[str, Any]:
         return {
             "message": "Hello World!",
             "timestamp": "2025-10-15"
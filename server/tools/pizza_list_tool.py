@@ -21,8 +21,9 @@ class PizzaListTool(BaseWidget):
         "connect_domains": [],
         "resource_domains": ["https://persistent.oaistatic.com"]
     }
+    warmup_arguments = {"pizzaTopping": "Margherita"}
     
-    async def execute(self, input_data: PizzaListInput) -> Dict[str, Any]:
+    async def execute(self, input_data: PizzaListInput, context=None, user=None) -> Dict[str, Any]:
         pizzerias = await get_pizzerias(input_data.pizza_topping)
         return {
             "pizzaTopping": input_data.pizza_topping,
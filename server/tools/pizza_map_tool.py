@@ -22,8 +22,9 @@ class PizzaMapTool(BaseWidget):
         "resource_domains": ["https://persistent.oaistatic.com"]
     }
     widget_prefers_border = True
+    warmup_arguments = {"pizzaTopping": "Margherita"}
     
-    async def execute(self, input_data: PizzaMapInput) -> Dict[str, Any]:
+    async def execute(self, input_data: PizzaMapInput, context=None, user=None) -> Dict[str, Any]:
         pizzerias = await get_pizzerias(input_data.pizza_topping)
         return {
             "pizzaTopping": input_data.pizza_topping,
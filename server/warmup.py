@@ -0,0 +1,129 @@
+"""
+Startup warmup 및 readiness gating
+
+새로 뜬 replica는 캐시가 비어 있고 코드 경로가 한 번도 실행되지 않아
+배포 직후 첫 요청들에서 latency spike가 생깁니다.
+서버 시작 후 백그라운드에서 warmup을 실행하고, 끝나기 전까지는
+/ready 가 503을 반환하므로 load balancer가 cold 인스턴스로 요청을 보내지 않습니다.
+"""
+
+import asyncio
+import os
+import time
+from typing import Any, Dict, List
+
+from mcp import types
+
+from server.api import warmup_pizzerias
+from server.lifespan import run_in_background
+
+DEFAULT_HOT_TOPPINGS = ["Margherita", "Pepperoni", "Hawaiian"]
+
+
+def hot_toppings_from_env() -> List[str]:
+    """WARMUP_TOPPINGS (예: "Margherita,Pepperoni") 또는 기본 hot topping 목록"""
+    raw = os.environ.get("WARMUP_TOPPINGS")
+    if raw is None:
+        return list(DEFAULT_HOT_TOPPINGS)
+    return [topping.strip() for topping in raw.split(",") if topping.strip()]
+
+
+class Warmup:
+    """
+    pizzeria store 캐시 → 각 tool 1회 실행 순서로 warmup 후 ready 상태로 전환
+
+    readiness는 tool 단계로 판단합니다 (pizzeria 단계는 mock 모드에서 실패할 수 없음).
+    warmup_optional = True 로 표시하지 않은 tool이 하나라도 실패하면 ready로
+    전환하지 않고 retry_interval부터 max_retry_interval까지 간격을 늘려가며 다시 시도합니다.
+    """
+
+    def __init__(
+        self,
+        server,
+        toppings: List[str],
+        retry_interval: float = 1.0,
+        max_retry_interval: float = 30.0,
+    ):
+        self.server = server
+        self.toppings = toppings
+        self.retry_interval = retry_interval
+        self.max_retry_interval = max_retry_interval
+        self.attempts = 0
+        self.ready = False
+        self.timings: Dict[str, float] = {}
+        self.errors: Dict[str, str] = {}
+
+    async def _timed(self, name: str, coro) -> bool:
+        started = time.monotonic()
+        try:
+            await coro
+            succeeded = True
+        except Exception as e:
+            self.errors[name] = str(e)
+            print(f"✗ Warmup failed for {name}: {e}")
+            succeeded = False
+        self.timings[name] = round(time.monotonic() - started, 4)
+        return succeeded
+
+    async def _call_tool(self, widget) -> None:
+        # 실제 call_tool 핸들러를 통해 실행 (입력 검증, 응답 직렬화까지 warm)
+        handler = self.server.mcp._mcp_server.request_handlers[types.CallToolRequest]
+        request = types.CallToolRequest(
+            method="tools/call",
+            params=types.CallToolRequestParams(
+                name=widget.identifier,
+                arguments=getattr(widget, "warmup_arguments", {}),
+            ),
+        )
+        result = await handler(request)
+        if result.root.isError:
+            raise RuntimeError(result.root.content[0].text)
+
+    async def _attempt(self) -> bool:
+        """warmup 1회 실행, optional이 아닌 tool이 모두 성공하면 True"""
+        self.attempts += 1
+        self.timings.clear()
+        self.errors.clear()
+
+        # 캐시만 채우는 단계 - 실패해도 tool 단계에서 upstream 상태가 드러남
+        await self._timed("pizzerias", warmup_pizzerias(self.toppings))
+
+        required = []
+        for identifier, widget in self.server.widgets_by_id.items():
+            succeeded = await self._timed(f"tool:{identifier}", self._call_tool(widget))
+            if not getattr(widget, "warmup_optional", False):
+                required.append(succeeded)
+        return all(required)
+
+    async def run(self):
+        delay = self.retry_interval
+        while not await self._attempt():
+            print(f"✗ Warmup failed, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_retry_interval)
+
+        # optional tool이나 pizzeria 단계의 실패는 errors에 남기고 ready로 전환
+        self.ready = True
+        print(f"✓ Warmup complete ({sum(self.timings.values()):.2f}s)")
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "ready": self.ready,
+            "attempts": self.attempts,
+            "toppings": self.toppings,
+            "timings": dict(self.timings),
+            "errors": dict(self.errors),
+        }
+
+
+def install_warmup(app, warmup: Warmup):
+    """app lifespan 시작 시 warmup 실행, /ready 엔드포인트 등록"""
+    from starlette.responses import JSONResponse
+    from starlette.routing import Route
+
+    run_in_background(app, warmup.run)
+
+    async def ready(request):
+        return JSONResponse(warmup.status(), status_code=200 if warmup.ready else 503)
+
+    app.routes.append(Route("/ready", ready, methods=["GET"]))
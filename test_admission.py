@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Test admission control: concurrency limits, bounded queue and load shedding"""
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+import sys
+
+from mcp import types
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from server.admission import (
+    AdmissionConfig,
+    AdmissionController,
+    Overloaded,
+    install_admission_control,
+)
+
+
+async def _call(controller, tool_name, delay):
+    async with controller.admit(tool_name):
+        await asyncio.sleep(delay)
+    return "ok"
+
+
+def test_per_tool_limit():
+    """Per-tool limit bounds in-flight work even when the global limit is higher"""
+    async def run():
+        controller = AdmissionController(AdmissionConfig(
+            max_inflight=10, tool_limits={"pizza_map": 2}, queue_size=10, queue_timeout=1.0
+        ))
+        peak = 0
+
+        async def watched():
+            nonlocal peak
+            async with controller.admit("pizza_map"):
+                peak = max(peak, controller.metrics()["inflight_by_tool"]["pizza_map"])
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(watched() for _ in range(6)))
+        assert peak == 2
+        assert controller.metrics()["admitted"] == 6
+        print("✓ Per-tool limit respected (peak in-flight: 2)")
+
+    asyncio.run(run())
+
+
+def test_queue_full_rejects_fast():
+    """Requests beyond max_inflight + queue_size are rejected immediately"""
+    async def run():
+        controller = AdmissionController(AdmissionConfig(
+            max_inflight=1, queue_size=1, queue_timeout=1.0
+        ))
+        results = await asyncio.gather(
+            *(_call(controller, "pizza_list", 0.05) for _ in range(4)),
+            return_exceptions=True,
+        )
+        rejected = [r for r in results if isinstance(r, Overloaded)]
+        assert len(rejected) == 2
+        assert all(r.reason == "queue_full" and r.retry_after >= 1 for r in rejected)
+        assert controller.metrics()["rejected"]["queue_full"] == 2
+        print("✓ Queue overflow shed with retry-after hint")
+
+    asyncio.run(run())
+
+
+def test_queue_timeout():
+    """Queued requests give up after queue_timeout"""
+    async def run():
+        controller = AdmissionController(AdmissionConfig(
+            max_inflight=1, queue_size=5, queue_timeout=0.02
+        ))
+        results = await asyncio.gather(
+            _call(controller, "pizza_list", 0.2),
+            _call(controller, "pizza_list", 0.0),
+            return_exceptions=True,
+        )
+        assert results[0] == "ok"
+        assert isinstance(results[1], Overloaded) and results[1].reason == "timeout"
+        metrics = controller.metrics()
+        assert metrics["waiting"] == 0 and metrics["inflight"] == 0
+        print("✓ Queued request timed out and released its place")
+
+    asyncio.run(run())
+
+
+def test_unknown_tools_bypass_admission():
+    """Unknown tool names create no per-tool state"""
+    async def run():
+        async def call_tool(req):
+            return types.ServerResult(types.CallToolResult(content=[], isError=True))
+
+        server = SimpleNamespace(
+            widgets_by_id={"pizza_list": object()},
+            mcp=SimpleNamespace(_mcp_server=SimpleNamespace(
+                request_handlers={types.CallToolRequest: call_tool}
+            )),
+        )
+        controller = AdmissionController()
+        install_admission_control(server, controller)
+        handler = server.mcp._mcp_server.request_handlers[types.CallToolRequest]
+
+        for i in range(100):
+            await handler(types.CallToolRequest(
+                method="tools/call",
+                params=types.CallToolRequestParams(name=f"junk-{i}", arguments={}),
+            ))
+        await handler(types.CallToolRequest(
+            method="tools/call",
+            params=types.CallToolRequestParams(name="pizza_list", arguments={}),
+        ))
+
+        assert list(controller._tools) == ["pizza_list"]
+        assert list(controller.metrics()["inflight_by_tool"]) == ["pizza_list"]
+        print("✓ Unknown tools passed through without per-tool state")
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    test_per_tool_limit()
+    test_queue_full_rejects_fast()
+    test_queue_timeout()
+    test_unknown_tools_bypass_admission()
+    print("\n✅ All admission tests passed!")
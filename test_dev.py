@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Test dev watch mode: change detection, build swap and tool module reload"""
+
+import asyncio
+import os
+from pathlib import Path
+import sys
+import tempfile
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from fastapps import WidgetBuildResult, WidgetMCPServer
+from server.dev import DevReloader
+from server.tools.pizza_list_tool import PizzaListTool
+
+
+def make_server():
+    tool = PizzaListTool(WidgetBuildResult(name="pizza_list", hash="abcd", html="<div>v1</div>"))
+    return WidgetMCPServer(name="dev-test", widgets=[tool])
+
+
+def test_detects_changed_widget_only():
+    """Only the widget whose files changed is reported"""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        for name in ["pizza_list", "pizza_map"]:
+            (root / "widgets" / name).mkdir(parents=True)
+            (root / "widgets" / name / "index.jsx").write_text("export default () => null;")
+
+        reloader = DevReloader(make_server(), root)
+        assert reloader._changes() == (set(), set())
+
+        index = root / "widgets" / "pizza_map" / "index.jsx"
+        os.utime(index, (index.stat().st_atime, index.stat().st_mtime + 1))
+        widgets, _ = reloader._changes()
+        assert widgets == {"pizza_map"}
+        print("✓ Only the edited widget is rebuilt")
+
+
+def test_swap_build_result():
+    """A rebuilt widget is swapped into the running server"""
+    server = make_server()
+    reloader = DevReloader(server, Path(tempfile.gettempdir()))
+
+    reloader.swap_build_result(WidgetBuildResult(name="pizza_list", hash="abcd", html="<div>v2</div>"))
+    assert server.widgets_by_id["pizza_list"].build_result.html == "<div>v2</div>"
+    print("✓ Build result swapped without restart")
+
+
+def test_reload_tool_module():
+    """Reloading a tool module replaces the tool instance but keeps its build"""
+    server = make_server()
+    old = server.widgets_by_id["pizza_list"]
+    reloader = DevReloader(server, Path(tempfile.gettempdir()))
+
+    reloader.reload_tool_module("pizza_list_tool")
+    new = server.widgets_by_id["pizza_list"]
+    assert new is not old
+    assert new.build_result is old.build_result
+    assert server.widgets_by_uri[new.template_uri] is new
+    print("✓ Tool module reloaded in place")
+
+
+def test_vanished_files_skipped():
+    """Files removed between glob and stat do not break the snapshot"""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        (root / "widgets" / "pizza_map").mkdir(parents=True)
+        reloader = DevReloader(make_server(), root)
+
+        temp_file = root / "widgets" / "pizza_map" / ".index.jsx.swp"
+        temp_file.write_text("")
+        original_glob = Path.glob
+
+        def glob_then_delete(self, pattern):
+            paths = list(original_glob(self, pattern))
+            if temp_file.exists():
+                temp_file.unlink()
+            return paths
+
+        Path.glob = glob_then_delete
+        try:
+            assert reloader._changes() == (set(), set())
+        finally:
+            Path.glob = original_glob
+        print("✓ Vanished editor temp file skipped")
+
+
+def test_watch_survives_errors():
+    """A failing rebuild is logged and the watch loop keeps polling"""
+    async def run():
+        reloader = DevReloader(make_server(), Path(tempfile.gettempdir()), interval=0.01)
+        polls = 0
+
+        async def failing_poll():
+            nonlocal polls
+            polls += 1
+            raise FileNotFoundError("npx")
+
+        reloader._poll = failing_poll
+        task = asyncio.create_task(reloader.watch())
+        await asyncio.sleep(0.1)
+        assert not task.done()
+        task.cancel()
+        assert polls > 1
+        print(f"✓ Watch loop kept running after {polls} failed polls")
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    test_detects_changed_widget_only()
+    test_swap_build_result()
+    test_reload_tool_module()
+    test_vanished_files_skipped()
+    test_watch_survives_errors()
+    print("\n✅ All dev reload tests passed!")
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""Test get_pizzerias resilience against a local stub upstream with injected latency"""
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+import sys
+
+import httpx
+from mcp import types
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from server.api.pizzeria_api import PizzeriaClient
+from server.api.resilience import (
+    BoundedCache,
+    CircuitBreaker,
+    CircuitOpenError,
+    deadline_scope,
+    install_call_deadline,
+    remaining_time,
+)
+
+PLACES = [{"name": "Stub Pizza", "address": "1 Stub St", "rating": 4.0, "lat": 0.0, "lng": 0.0}]
+
+
+class StubUpstream:
+    """Local stub: per-request latencies (seconds) and failure switch"""
+
+    def __init__(self, latencies=None, fail=False):
+        self.latencies = list(latencies or [])
+        self.fail = fail
+        self.calls = 0
+
+    async def handler(self, request):
+        self.calls += 1
+        if self.latencies:
+            await asyncio.sleep(self.latencies.pop(0))
+        if self.fail:
+            return httpx.Response(503)
+        return httpx.Response(200, json=PLACES)
+
+    def client(self, **kwargs):
+        # 매 호출이 upstream까지 가도록 fresh cache는 끔
+        kwargs.setdefault("cache_ttl", 0)
+        return PizzeriaClient(
+            base_url="http://stub", transport=httpx.MockTransport(self.handler), **kwargs
+        )
+
+
+def test_deadline_propagates():
+    """A slow upstream is cut off by the tool call deadline"""
+    async def run():
+        client = StubUpstream(latencies=[1.0]).client()
+        with deadline_scope(0.05):
+            try:
+                await client.get_pizzerias("Margherita")
+            except asyncio.TimeoutError:
+                print("✓ Upstream call cancelled at the deadline")
+                return
+        raise AssertionError("Expected TimeoutError")
+
+    asyncio.run(run())
+
+
+def test_hedged_request():
+    """A second attempt after the hedge delay wins over a slow first attempt"""
+    async def run():
+        stub = StubUpstream(latencies=[1.0, 0.0])
+        client = stub.client(hedge=True)
+        client.latency.default = 0.02
+
+        with deadline_scope(0.5):
+            places = await client.get_pizzerias("Margherita")
+        assert places == PLACES
+        assert stub.calls == 2
+        print("✓ Hedged request answered before the slow attempt")
+
+    asyncio.run(run())
+
+
+def test_breaker_serves_stale():
+    """Once the breaker opens, calls fail fast to the last good result"""
+    async def run():
+        stub = StubUpstream()
+        breaker = CircuitBreaker(min_calls=2, reset_timeout=60)
+        client = stub.client(breaker=breaker)
+
+        assert await client.get_pizzerias("Pepperoni") == PLACES
+
+        stub.fail = True
+        for _ in range(2):
+            assert await client.get_pizzerias("Pepperoni") == PLACES
+        assert breaker.state == "open"
+
+        calls = stub.calls
+        assert await client.get_pizzerias("Pepperoni") == PLACES
+        assert stub.calls == calls, "open breaker must not hit upstream"
+
+        try:
+            await client.get_pizzerias("Hawaiian")
+        except CircuitOpenError:
+            print("✓ Breaker open: stale data served, no stale data fails fast")
+            return
+        raise AssertionError("Expected CircuitOpenError")
+
+    asyncio.run(run())
+
+
+def test_breaker_half_open_recovers():
+    """After reset_timeout a successful trial call closes the breaker"""
+    async def run():
+        breaker = CircuitBreaker(min_calls=1, reset_timeout=0.01)
+
+        async def fail():
+            raise RuntimeError("upstream down")
+
+        async def ok():
+            return "ok"
+
+        try:
+            await breaker.call(fail)
+        except RuntimeError:
+            pass
+        assert breaker.state == "open"
+
+        await asyncio.sleep(0.02)
+        assert breaker.state == "half_open"
+        assert await breaker.call(ok) == "ok"
+        assert breaker.state == "closed"
+        print("✓ Breaker closed after successful half-open trial")
+
+    asyncio.run(run())
+
+
+def test_caller_deadline_does_not_open_breaker():
+    """Client deadlines shorter than the observed p95 are not upstream failures"""
+    async def run():
+        breaker = CircuitBreaker(min_calls=2, reset_timeout=60)
+        client = StubUpstream(latencies=[0.2] * 5).client(breaker=breaker)
+        for _ in range(20):
+            client.latency.record(0.2)
+
+        for _ in range(5):
+            with deadline_scope(0.01):
+                try:
+                    await client.get_pizzerias("Margherita")
+                except asyncio.TimeoutError:
+                    pass
+        assert breaker.state == "closed"
+        print("✓ Client deadlines leave the breaker closed")
+
+    asyncio.run(run())
+
+
+def test_hung_upstream_opens_breaker_under_short_timeout_ms():
+    """A hung upstream opens the breaker even when clients send short timeoutMs"""
+    async def run():
+        breaker = CircuitBreaker(min_calls=5, reset_timeout=60)
+        client = StubUpstream(latencies=[10.0] * 10).client(breaker=breaker)
+
+        async def call_tool(req):
+            try:
+                await client.get_pizzerias("Margherita")
+            except asyncio.TimeoutError:
+                return "timeout"
+            except CircuitOpenError:
+                return "open"
+
+        server = SimpleNamespace(mcp=SimpleNamespace(_mcp_server=SimpleNamespace(
+            request_handlers={types.CallToolRequest: call_tool}
+        )))
+        install_call_deadline(server, timeout=5.0)
+        handler = server.mcp._mcp_server.request_handlers[types.CallToolRequest]
+
+        outcomes = []
+        for _ in range(10):
+            outcomes.append(await handler(types.CallToolRequest(
+                method="tools/call",
+                params=types.CallToolRequestParams(
+                    name="pizza_list", arguments={}, _meta={"timeoutMs": 50}
+                ),
+            )))
+        assert breaker.state == "open"
+        assert outcomes[:5] == ["timeout"] * 5 and outcomes[5:] == ["open"] * 5
+        print("✓ Hung upstream opened the breaker; later calls fail fast")
+
+    asyncio.run(run())
+
+
+def test_invalid_timeout_ms_ignored():
+    """Malformed _meta.timeoutMs falls back to the server timeout"""
+    async def run():
+        budgets = []
+
+        async def call_tool(req):
+            budgets.append(remaining_time())
+            return None
+
+        server = SimpleNamespace(mcp=SimpleNamespace(_mcp_server=SimpleNamespace(
+            request_handlers={types.CallToolRequest: call_tool}
+        )))
+        install_call_deadline(server, timeout=5.0)
+        handler = server.mcp._mcp_server.request_handlers[types.CallToolRequest]
+
+        for timeout_ms in ["abc", -1, None, 100]:
+            await handler(types.CallToolRequest(
+                method="tools/call",
+                params=types.CallToolRequestParams(
+                    name="pizza_list", arguments={}, _meta={"timeoutMs": timeout_ms}
+                ),
+            ))
+        assert all(4.0 < budget <= 5.0 for budget in budgets[:3])
+        assert budgets[3] <= 0.1
+        print("✓ Invalid timeoutMs ignored")
+
+    asyncio.run(run())
+
+
+def test_stale_cache_bounded():
+    """Stale results are evicted by size (LRU) and by age"""
+    cache = BoundedCache(max_entries=2, max_age=60)
+    for topping in ["a", "b", "c"]:
+        cache.put(topping, [topping])
+    assert "a" not in cache and len(cache) == 2
+
+    cache.max_age = 0
+    assert cache.get("c") is None
+    print("✓ Stale cache bounded by size and age")
+
+
+if __name__ == "__main__":
+    test_deadline_propagates()
+    test_hedged_request()
+    test_breaker_serves_stale()
+    test_breaker_half_open_recovers()
+    test_caller_deadline_does_not_open_breaker()
+    test_hung_upstream_opens_breaker_under_short_timeout_ms()
+    test_invalid_timeout_ms_ignored()
+    test_stale_cache_bounded()
+    print("\n✅ All resilience tests passed!")
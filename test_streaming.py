@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Test the StreamingWidget extension point: partial results and progress notifications"""
+
+import asyncio
+from pathlib import Path
+import sys
+
+from mcp import types
+from mcp.server.lowlevel.server import request_ctx
+from mcp.shared.context import RequestContext
+from pydantic import BaseModel
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from fastapps import WidgetBuildResult, WidgetMCPServer
+from server.loader import tool_classes
+from server.streaming import StreamingWidget, install_streaming
+
+PAGES = [[{"name": f"Stub Pizza {i}"} for i in range(start, start + 2)] for start in (0, 2)]
+
+
+class PagedInput(BaseModel):
+    topping: str
+
+
+class PagedTool(StreamingWidget):
+    identifier = "paged"
+    title = "Paged"
+    input_schema = PagedInput
+    invoking = "Loading..."
+    invoked = "Loaded"
+
+    async def stream(self, input_data: PagedInput):
+        yield {"topping": input_data.topping, "places": []}
+        for page in PAGES:
+            yield {"places": page}
+
+
+class RecordingSession:
+    def __init__(self):
+        self.notifications = []
+
+    async def send_notification(self, notification, related_request_id=None):
+        self.notifications.append((notification.root, related_request_id))
+
+
+def make_handler():
+    tool = PagedTool(WidgetBuildResult(name="paged", hash="abcd", html="<div></div>"))
+    server = WidgetMCPServer(name="streaming-test", widgets=[tool])
+    install_streaming(server)
+    return server.mcp._mcp_server.request_handlers[types.CallToolRequest]
+
+
+def call(meta=None):
+    return types.CallToolRequest(
+        method="tools/call",
+        params=types.CallToolRequestParams(name="paged", arguments={"topping": "Margherita"}, _meta=meta),
+    )
+
+
+def test_progress_notifications():
+    """Partial results are sent as progress notifications, final result is merged"""
+    async def run():
+        handler = make_handler()
+        session = RecordingSession()
+        request_ctx.set(RequestContext(request_id=7, meta=None, session=session, lifespan_context=None))
+        result = await handler(call({"progressToken": "tok"}))
+
+        partials = [n.params.meta.model_extra["openai/partialResult"] for n, _ in session.notifications]
+        assert partials == [{"topping": "Margherita", "places": []}, {"places": PAGES[0]}, {"places": PAGES[1]}]
+        assert all(n.params.progressToken == "tok" and rid == 7 for n, rid in session.notifications)
+        assert result.root.structuredContent == {"topping": "Margherita", "places": PAGES[0] + PAGES[1]}
+        print(f"✓ {len(partials)} progress notifications, final result merged")
+
+    asyncio.run(run())
+
+
+def test_no_notifications_without_progress_token():
+    """Without a progressToken only the merged final result is returned"""
+    async def run():
+        handler = make_handler()
+        session = RecordingSession()
+        request_ctx.set(RequestContext(request_id=8, meta=None, session=session, lifespan_context=None))
+        result = await handler(call())
+
+        assert session.notifications == []
+        assert result.root.structuredContent["places"] == PAGES[0] + PAGES[1]
+        print("✓ No notifications without a progressToken")
+
+    asyncio.run(run())
+
+
+def test_loader_skips_abstract_base():
+    """Importing StreamingWidget into a tool module does not register it as a tool"""
+    module = type(sys)("fake_tool")
+    module.StreamingWidget = StreamingWidget
+    module.PagedTool = PagedTool
+    assert tool_classes(module) == [("PagedTool", PagedTool)]
+    print("✓ Abstract StreamingWidget skipped by tool discovery")
+
+
+if __name__ == "__main__":
+    test_progress_notifications()
+    test_no_notifications_without_progress_token()
+    test_loader_skips_abstract_base()
+    print("\n✅ All streaming tests passed!")
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Test startup warmup and readiness gating"""
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+import sys
+
+import httpx
+from mcp import types
+from starlette.applications import Starlette
+from starlette.testclient import TestClient
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import server.warmup as warmup_module
+from server.api.pizzeria_api import PizzeriaClient
+from server.warmup import Warmup, install_warmup
+
+
+def make_server(release: asyncio.Event = None, is_error: bool = False, optional: bool = False):
+    """Minimal stand-in for WidgetMCPServer: one widget and a call_tool handler"""
+    calls = []
+
+    async def call_tool(req):
+        calls.append((req.params.name, req.params.arguments))
+        if release is not None:
+            await release.wait()
+        return types.ServerResult(types.CallToolResult(
+            content=[types.TextContent(type="text", text="Error: upstream down")],
+            isError=is_error,
+        ))
+
+    widget = SimpleNamespace(
+        identifier="pizza_list",
+        warmup_arguments={"pizzaTopping": "Margherita"},
+        warmup_optional=optional,
+    )
+    server = SimpleNamespace(
+        widgets_by_id={"pizza_list": widget},
+        mcp=SimpleNamespace(_mcp_server=SimpleNamespace(
+            request_handlers={types.CallToolRequest: call_tool}
+        )),
+    )
+    return server, calls
+
+
+def test_warmup_preloads_and_exercises_tools():
+    """Warmup runs the pizzeria step and each tool once"""
+    server, calls = make_server()
+    warmup = Warmup(server, toppings=["Pepperoni"])
+
+    asyncio.run(warmup.run())
+
+    assert warmup.ready
+    assert calls == [("pizza_list", {"pizzaTopping": "Margherita"})]
+    assert not warmup.errors
+    print("✓ Pizzeria store warmed and tools exercised")
+
+
+def test_warmed_cache_serves_first_call():
+    """The first real call after warmup is answered from the warmed cache"""
+    async def run():
+        calls = []
+
+        async def handler(request):
+            calls.append(request.url.params["topping"])
+            return httpx.Response(200, json=[{"name": "Stub Pizza"}])
+
+        client = PizzeriaClient(base_url="http://stub", transport=httpx.MockTransport(handler))
+        await client.warmup(["Pepperoni", "Hawaiian"])
+        assert await client.get_pizzerias("Pepperoni") == [{"name": "Stub Pizza"}]
+        assert calls == ["Pepperoni", "Hawaiian"]
+        print("✓ First call after warmup served from cache")
+
+    asyncio.run(run())
+
+
+def test_not_ready_when_all_steps_fail():
+    """If every warmup step fails the replica stays unready and retries"""
+    async def failing_pizzerias(toppings):
+        raise RuntimeError("upstream down")
+
+    async def run():
+        server, _ = make_server(is_error=True)
+        warmup = Warmup(server, toppings=["Pepperoni"], retry_interval=0.01)
+        task = asyncio.create_task(warmup.run())
+        await asyncio.sleep(0.1)
+        task.cancel()
+
+        assert not warmup.ready
+        assert warmup.attempts > 1
+        assert set(warmup.errors) == {"pizzerias", "tool:pizza_list"}
+        print(f"✓ Still unready after {warmup.attempts} failed attempts")
+
+    original = warmup_module.warmup_pizzerias
+    warmup_module.warmup_pizzerias = failing_pizzerias
+    try:
+        asyncio.run(run())
+    finally:
+        warmup_module.warmup_pizzerias = original
+
+
+def test_tool_failure_keeps_unready():
+    """A failing tool keeps the replica unready even though the pizzeria step succeeds"""
+    async def run():
+        server, _ = make_server(is_error=True)
+        warmup = Warmup(server, toppings=["Pepperoni"], retry_interval=0.01)
+        task = asyncio.create_task(warmup.run())
+        await asyncio.sleep(0.1)
+        task.cancel()
+
+        assert not warmup.ready
+        assert set(warmup.errors) == {"tool:pizza_list"}
+        print("✓ Unready while a required tool fails")
+
+    asyncio.run(run())
+
+
+def test_optional_tool_failure_still_ready():
+    """Tools marked warmup_optional do not gate readiness"""
+    server, _ = make_server(is_error=True, optional=True)
+    warmup = Warmup(server, toppings=["Pepperoni"])
+
+    asyncio.run(warmup.run())
+
+    assert warmup.ready
+    assert set(warmup.errors) == {"tool:pizza_list"}
+    print("✓ Optional tool failure recorded without blocking readiness")
+
+
+def test_ready_endpoint_gates_until_warm():
+    """/ready returns 503 while warming up and 200 afterwards"""
+    release = asyncio.Event()
+    server, _ = make_server(release)
+    warmup = Warmup(server, toppings=[])
+    app = Starlette()
+    install_warmup(app, warmup)
+
+    with TestClient(app) as client:
+        assert client.get("/ready").status_code == 503
+        client.portal.call(release.set)
+        for _ in range(100):
+            if client.get("/ready").status_code == 200:
+                break
+        assert client.get("/ready").json()["ready"] is True
+    print("✓ /ready gated on warmup")
+
+
+if __name__ == "__main__":
+    test_warmup_preloads_and_exercises_tools()
+    test_warmed_cache_serves_first_call()
+    test_not_ready_when_all_steps_fail()
+    test_tool_failure_keeps_unready()
+    test_optional_tool_failure_still_ready()
+    test_ready_endpoint_gates_until_warm()
+    print("\n✅ All warmup tests passed!")